@@ -27,20 +27,18 @@ from pydrake.symbolic import Variable, Polynomial
 
 
 class TestGeometryOptimization(unittest.TestCase):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.A = np.eye(3)
-        self.b = np.array([1.0, 1.0, 1.0])
-        self.prog = MathematicalProgram()
-        self.x = self.prog.NewContinuousVariables(3, "x")
-        self.t = self.prog.NewContinuousVariables(1, "t")[0]
-
-        self.Ay = np.array([[1., 0.], [0., 1.], [1., 0.]])
-        self.by = np.ones(3)
-        self.cz = np.ones(2)
-        self.dz = 1.
-        self.y = self.prog.NewContinuousVariables(2, "y")
-        self.z = self.prog.NewContinuousVariables(2, "z")
+    # Numeric data shared (read-only) by all tests.
+    A = np.eye(3)
+    b = np.array([1.0, 1.0, 1.0])
+    Ay = np.array([[1., 0.], [0., 1.], [1., 0.]])
+    by = np.ones(3)
+    cz = np.ones(2)
+    dz = 1.
+    A.flags.writeable = False
+    b.flags.writeable = False
+    Ay.flags.writeable = False
+    by.flags.writeable = False
+    cz.flags.writeable = False
 
     def test_point_convex_set(self):
         mut.Point()
@@ -178,18 +176,6 @@ class TestGeometryOptimization(unittest.TestCase):
         self.assertFalse(hpoly.MaybeGetFeasiblePoint() is None)
         self.assertTrue(hpoly.PointInSet(hpoly.MaybeGetFeasiblePoint()))
         self.assertFalse(hpoly.IsBounded())
-        new_vars, new_constraints = hpoly.AddPointInSetConstraints(
-            self.prog, self.x)
-        self.assertEqual(new_vars.size, 0)
-        constraints = hpoly.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, x=self.x, t=self.t)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
-        constraints = hpoly.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, A=self.Ay, b=self.by, c=self.cz, d=self.dz,
-            x=self.y, t=self.z)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
         with self.assertRaisesRegex(
                 RuntimeError, ".*not implemented yet for HPolyhedron.*"):
             hpoly.ToShapeWithPose()
@@ -318,19 +304,6 @@ class TestGeometryOptimization(unittest.TestCase):
         np.testing.assert_array_equal(ellipsoid.A(), self.A)
         np.testing.assert_array_equal(ellipsoid.center(), self.b)
         self.assertTrue(ellipsoid.PointInSet(x=self.b, tol=0.0))
-        new_vars, new_constraints = ellipsoid.AddPointInSetConstraints(
-            self.prog, self.x)
-        self.assertEqual(new_vars.size, 0)
-        self.assertGreater(len(new_constraints), 0)
-        constraints = ellipsoid.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, x=self.x, t=self.t)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
-        constraints = ellipsoid.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, A=self.Ay, b=self.by, c=self.cz, d=self.dz,
-            x=self.y, t=self.z)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
         shape, pose = ellipsoid.ToShapeWithPose()
         self.assertIsInstance(shape, Ellipsoid)
         self.assertIsInstance(pose, RigidTransform)
@@ -375,19 +348,6 @@ class TestGeometryOptimization(unittest.TestCase):
         point = rect.MaybeGetFeasiblePoint()
         self.assertTrue(point is not None)
         self.assertTrue(rect.PointInSet(x=point, tol=0.0))
-        new_vars, new_constraints = rect.AddPointInSetConstraints(
-            self.prog, self.x)
-        self.assertEqual(new_vars.size, 0)
-        self.assertGreater(len(new_constraints), 0)
-        constraints = rect.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, x=self.x, t=self.t)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
-        constraints = rect.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, A=self.Ay, b=self.by, c=self.cz, d=self.dz,
-            x=self.y, t=self.z)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
         shape, pose = rect.ToShapeWithPose()
         self.assertTrue(isinstance(shape, Box))
         np.testing.assert_array_equal(pose.translation(),
@@ -471,18 +431,6 @@ class TestGeometryOptimization(unittest.TestCase):
         self.assertEqual(vpoly.ambient_dimension(), 2)
         np.testing.assert_array_equal(vpoly.vertices(), vertices)
         self.assertTrue(vpoly.PointInSet(x=[1.0, 5.0], tol=1e-8))
-        new_vars, new_constraints = vpoly.AddPointInSetConstraints(
-            self.prog, self.x[0:2])
-        self.assertEqual(new_vars.size, vertices.shape[1])
-        constraints = vpoly.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, x=self.x[:2], t=self.t)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
-        constraints = vpoly.AddPointInNonnegativeScalingConstraints(
-            prog=self.prog, A=self.Ay[:2], b=self.by[:2], c=self.cz, d=self.dz,
-            x=self.y, t=self.z)
-        self.assertGreaterEqual(len(constraints), 2)
-        self.assertIsInstance(constraints[0], Binding[Constraint])
         assert_pickle(self, vpoly, lambda S: S.vertices())
         v_box = mut.VPolytope.MakeBox(
             lb=[-1, -1, -1], ub=[1, 1, 1])
@@ -497,14 +445,13 @@ class TestGeometryOptimization(unittest.TestCase):
         # 2D: Random points inside a circle
         r = 2.0
         n = 400
-        vertices = np.zeros((2, n + 4))
         theta = np.linspace(0, 2 * np.pi, n, endpoint=False)
-        vertices[0, 0:n] = r * np.cos(theta)
-        vertices[1, 0:n] = r * np.sin(theta)
-        vertices[:, n:] = np.array([
+        circle = r * np.stack([np.cos(theta), np.sin(theta)])
+        extras = np.array([
             [r/2, r/3, r/4, r/5],
             [r/2, r/3, r/4, r/5]
         ])
+        vertices = np.concatenate([circle, extras], axis=1)
 
         vpoly = mut.VPolytope(vertices=vertices)
         vpoly = vpoly.GetMinimalRepresentation(tol=1e-9)
@@ -544,15 +491,45 @@ class TestGeometryOptimization(unittest.TestCase):
             "convex_from_vpolytope")
 
     def _calculate_path_length(self, vertices):
-        n = vertices.shape[1]
-        length = 0
-
-        for i in range(n):
-            j = (i + 1) % n
-            diff = vertices[:, i] - vertices[:, j]
-            length += np.sqrt(np.dot(diff, diff))
+        diff = vertices - np.roll(vertices, shift=-1, axis=1)
+        return np.linalg.norm(diff, axis=0).sum()
+
+    def _check_add_point_in_set_constraints(self, cset):
+        """Exercises the AddPointIn*Constraints bindings of `cset` on a fresh
+        MathematicalProgram, and returns the new decision variables added by
+        AddPointInSetConstraints."""
+        dim = cset.ambient_dimension()
+        prog = MathematicalProgram()
+        x = prog.NewContinuousVariables(dim, "x")
+        t = prog.NewContinuousVariables(1, "t")[0]
+        y = prog.NewContinuousVariables(2, "y")
+        z = prog.NewContinuousVariables(2, "z")
+        new_vars, new_constraints = cset.AddPointInSetConstraints(prog, x)
+        self.assertGreater(len(new_constraints), 0)
+        constraints = cset.AddPointInNonnegativeScalingConstraints(
+            prog=prog, x=x, t=t)
+        self.assertGreaterEqual(len(constraints), 2)
+        self.assertIsInstance(constraints[0], Binding[Constraint])
+        constraints = cset.AddPointInNonnegativeScalingConstraints(
+            prog=prog, A=self.Ay[:dim], b=self.by[:dim], c=self.cz, d=self.dz,
+            x=y, t=z)
+        self.assertGreaterEqual(len(constraints), 2)
+        self.assertIsInstance(constraints[0], Binding[Constraint])
+        return new_vars
 
-        return length
+    def test_add_point_in_set_constraints(self):
+        vertices = np.array([[0.0, 1.0, 2.0], [3.0, 7.0, 5.0]])
+        # Pairs of (set, num new variables from AddPointInSetConstraints).
+        cases = [
+            (mut.HPolyhedron(A=self.A, b=self.b), 0),
+            (mut.Hyperellipsoid(A=self.A, center=self.b), 0),
+            (mut.Hyperrectangle(lb=-self.b, ub=self.b), 0),
+            (mut.VPolytope(vertices=vertices), vertices.shape[1]),
+        ]
+        for cset, num_new_vars in cases:
+            with self.subTest(cset=type(cset).__name__):
+                new_vars = self._check_add_point_in_set_constraints(cset)
+                self.assertEqual(new_vars.size, num_new_vars)
 
     def test_cartesian_product(self):
         mut.CartesianProduct()
@@ -648,10 +625,11 @@ class TestGeometryOptimization(unittest.TestCase):
             geometry=GeometryInstance(X_PG=RigidTransform(),
                                       shape=Capsule(1., 1.0),
                                       name="capsule"))
-        for geometry_id in [box_geometry_id, cylinder_geometry_id,
-                            sphere_geometry_id, capsule_geometry_id]:
+        properties = ProximityProperties()
+        for geometry_id in (box_geometry_id, cylinder_geometry_id,
+                            sphere_geometry_id, capsule_geometry_id):
             scene_graph.AssignRole(source_id, geometry_id,
-                                   properties=ProximityProperties())
+                                   properties=properties)
         context = scene_graph.CreateDefaultContext()
         pose_vector = FramePoseVector()
         pose_vector.set_value(frame_id, RigidTransform())